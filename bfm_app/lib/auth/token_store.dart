@@ -12,10 +12,31 @@ class TokenStore {
 
   static const _key = 'cred.moni.access_token';
 
-  Future<String?> getToken() => _storage.read(key: _key);
+  /// Process-wide cache of the last read/written token. The ApiClient
+  /// interceptor calls [getToken] on every request, and each secure-storage
+  /// read is a platform-channel round trip; the token only changes through
+  /// [setToken]/[clear], so one read per process is enough. Shared across
+  /// instances because they all wrap the same storage key.
+  static String? _cachedToken;
+  static bool _cacheValid = false;
 
-  Future<void> setToken(String token) =>
-      _storage.write(key: _key, value: token);
+  Future<String?> getToken() async {
+    if (_cacheValid) return _cachedToken;
+    final token = await _storage.read(key: _key);
+    _cachedToken = token;
+    _cacheValid = true;
+    return token;
+  }
 
-  Future<void> clear() => _storage.delete(key: _key);
+  Future<void> setToken(String token) async {
+    await _storage.write(key: _key, value: token);
+    _cachedToken = token;
+    _cacheValid = true;
+  }
+
+  Future<void> clear() async {
+    await _storage.delete(key: _key);
+    _cachedToken = null;
+    _cacheValid = true;
+  }
 }
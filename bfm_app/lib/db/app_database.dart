@@ -23,6 +23,7 @@
 /// ---------------------------------------------------------------------------
 
 import 'dart:async';
+import 'package:bfm_app/repositories/category_repository.dart';
 import 'package:path/path.dart';
 import 'package:sqflite/sqflite.dart';
 
@@ -36,6 +37,10 @@ class AppDatabase {
   static final AppDatabase instance = AppDatabase._init();
   static Database? _database;
   static Completer<Database>? _initCompleter;
+  static Database? _readDatabase;
+  static Completer<Database>? _readInitCompleter;
+
+  static const _dbFileName = "bfm_app.db";
 
   AppDatabase._init();
 
@@ -47,7 +52,7 @@ class AppDatabase {
 
     _initCompleter = Completer<Database>();
     try {
-      _database = await _initDB("bfm_app.db");
+      _database = await _initDB(_dbFileName);
       _initCompleter!.complete(_database!);
     } catch (e) {
       _initCompleter!.completeError(e);
@@ -57,6 +62,35 @@ class AppDatabase {
     return _database!;
   }
 
+  /// Read-only companion connection for heavy aggregation queries.
+  ///
+  /// With WAL on, a second connection lets dashboards keep reading while a
+  /// sync batch holds the write lock on [database]; on the single shared
+  /// handle those reads would queue behind the whole transaction. Opened with
+  /// `singleInstance: false` so sqflite gives us a genuinely separate native
+  /// connection, and only after [database] so migrations have already run.
+  Future<Database> get readDatabase async {
+    if (_readDatabase != null) return _readDatabase!;
+    if (_readInitCompleter != null) return _readInitCompleter!.future;
+
+    _readInitCompleter = Completer<Database>();
+    try {
+      await database;
+      final dbPath = await getDatabasesPath();
+      _readDatabase = await openDatabase(
+        join(dbPath, _dbFileName),
+        readOnly: true,
+        singleInstance: false,
+      );
+      _readInitCompleter!.complete(_readDatabase!);
+    } catch (e) {
+      _readInitCompleter!.completeError(e);
+      _readInitCompleter = null;
+      rethrow;
+    }
+    return _readDatabase!;
+  }
+
   /// Resolves the on-disk path, opens the database with the current schema
   /// version, enables FK constraints, and wires create/upgrade callbacks.
   Future<Database> _initDB(String filePath) async {
@@ -66,9 +100,16 @@ class AppDatabase {
     // Open the database with version and an onUpgrade callback
     return await openDatabase(
       path,
-      version: 27,
+      version: 29,
       onConfigure: (db) async {
         await db.execute('PRAGMA foreign_keys = ON;');
+        // WAL lets readers proceed while a sync batch is committing, and
+        // synchronous=NORMAL drops the per-commit fsync that dominates the
+        // cost of small writes. journal_mode returns a row, so query it.
+        await db.rawQuery('PRAGMA journal_mode = WAL;');
+        await db.execute('PRAGMA synchronous = NORMAL;');
+        await db.execute('PRAGMA temp_store = MEMORY;');
+        await db.execute('PRAGMA cache_size = -8000;');
       },
       onCreate: _createDB,
       onUpgrade: _upgradeDB,
@@ -162,7 +203,11 @@ class AppDatabase {
       await db.execute('ALTER TABLE events ADD COLUMN description TEXT;');
     }
     if (!await hasTable('goal_progress_log')) await _createGoalProgressLog(db);
-    if (!await hasTable('weekly_reports')) await _createWeeklyReports(db);
+    if (!await hasTable('weekly_reports')) {
+      await _createWeeklyReports(db);
+    } else if (await hasCol('weekly_reports', 'id')) {
+      await _recreateWeeklyReportsTable(db);
+    }
     if (!await hasTable('accounts')) await _createAccounts(db);
     if (!await hasCol('accounts', 'excluded')) {
       await db.execute(
@@ -216,12 +261,12 @@ class AppDatabase {
         'ALTER TABLE budgets ADD COLUMN recurring_transaction_id INTEGER;',
       );
     }
+    // Unconditional: column-present does not imply index-present (older
+    // installs gained the column before this index existed).
     await db.execute(
       'CREATE INDEX IF NOT EXISTS ix_budgets_recurring_transaction_id ON budgets(recurring_transaction_id);',
     );
 
-    await _createGoalProgressLog(db);
-
     // ---- transaction columns ----
     if (!await hasCol('transactions', 'akahu_id')) {
       await db.execute('ALTER TABLE transactions ADD COLUMN akahu_id TEXT;');
@@ -252,14 +297,16 @@ class AppDatabase {
     if (!await hasCol('transactions', 'akahu_hash')) {
       await db.execute('ALTER TABLE transactions ADD COLUMN akahu_hash TEXT;');
     }
+    // Unconditional: an install whose akahu_hash column predates this index
+    // would otherwise never get it, and the upsert dedup depends on it.
+    await db.execute(
+      'CREATE UNIQUE INDEX IF NOT EXISTS ux_transactions_akahu_hash ON transactions(akahu_hash) WHERE akahu_hash IS NOT NULL;',
+    );
     if (!await hasCol('transactions', 'excluded')) {
       await db.execute(
         "ALTER TABLE transactions ADD COLUMN excluded INTEGER NOT NULL DEFAULT 0;",
       );
     }
-    await db.execute(
-      'CREATE UNIQUE INDEX IF NOT EXISTS ux_transactions_akahu_hash ON transactions(akahu_hash) WHERE akahu_hash IS NOT NULL;',
-    );
 
     // ---- category columns ----
     if (!await hasCol('categories', 'akahu_category_id')) {
@@ -282,6 +329,11 @@ class AppDatabase {
     // Recreate helpful indexes & triggers for category usage tracking
     await _ensureIndexesAndTriggers(db);
 
+    // Covering index for spend aggregates; created here as well because
+    // upgraded databases never re-run _createTransactions. Safe now that the
+    // excluded column exists on every path above.
+    await _createSpendCoveringIndex(db);
+
     // Backfill usage_count from existing transactions
     await db.rawUpdate('''
       UPDATE categories
@@ -391,6 +443,18 @@ class AppDatabase {
     await db.execute(
       'CREATE UNIQUE INDEX IF NOT EXISTS ux_transactions_akahu_hash ON transactions(akahu_hash) WHERE akahu_hash IS NOT NULL;',
     );
+    await _createSpendCoveringIndex(db);
+  }
+
+  /// Covering index for the spend aggregates: equality columns first
+  /// (type, excluded), then the date range, then every column those queries
+  /// read (category_id, amount, account_id) so SQLite answers them from the
+  /// index B-tree alone without fetching transaction rows.
+  Future<void> _createSpendCoveringIndex(Database db) async {
+    await db.execute(
+      'CREATE INDEX IF NOT EXISTS ix_transactions_spend '
+      'ON transactions(type, excluded, date, category_id, amount, account_id);',
+    );
   }
 
   /// Base DDL for the `goals` table with saved amount tracking.
@@ -510,18 +574,33 @@ class AppDatabase {
   }
 
   /// Stores dashboard snapshots per week so we can show historical reports.
+  /// Every access is a point lookup on `week_start`, so the table is declared
+  /// WITHOUT ROWID: the key B-tree *is* the table and each read costs a
+  /// single descent instead of index-then-rowid.
   Future<void> _createWeeklyReports(Database db) async {
     await db.execute('''
       CREATE TABLE IF NOT EXISTS weekly_reports (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        week_start TEXT NOT NULL UNIQUE,
+        week_start TEXT PRIMARY KEY,
         week_end TEXT NOT NULL,
         data TEXT NOT NULL,
         created_at TEXT DEFAULT CURRENT_TIMESTAMP
-      );
+      ) WITHOUT ROWID;
     ''');
   }
 
+  /// Migrates a legacy rowid-based weekly_reports table (autoincrement id +
+  /// unique week_start) to the WITHOUT ROWID layout, keeping existing rows.
+  Future<void> _recreateWeeklyReportsTable(Database db) async {
+    await db.execute('ALTER TABLE weekly_reports RENAME TO weekly_reports_old;');
+    await _createWeeklyReports(db);
+    await db.execute('''
+      INSERT OR REPLACE INTO weekly_reports (week_start, week_end, data, created_at)
+      SELECT week_start, week_end, data, created_at
+      FROM weekly_reports_old;
+    ''');
+    await db.execute('DROP TABLE weekly_reports_old;');
+  }
+
   /// Stores connected bank accounts from Akahu for balance tracking.
   Future<void> _createAccounts(Database db) async {
     await db.execute('''
@@ -809,11 +888,22 @@ class AppDatabase {
     ''');
   }
 
-  /// Closes the cached database connection so the next call re-opens it.
+  /// Closes the cached database connections so the next call re-opens them.
   Future close() async {
+    // Caches keyed on this database's contents die with the handle; the next
+    // open may point at a different or freshly created file (tests recreate
+    // it per case), where the cached ids mean nothing.
+    CategoryRepository.clearCache();
+    final readDb = _readDatabase;
+    if (readDb != null) {
+      await readDb.close();
+      _readDatabase = null;
+      _readInitCompleter = null;
+    }
     final db = _database;
     if (db == null) return;
     await db.close();
     _database = null;
+    _initCompleter = null;
   }
 }
@@ -11,6 +11,8 @@
 ///   `weekly_overview_service.dart` for UI payloads.
 /// ---------------------------------------------------------------------------
 
+import 'package:bfm_app/utils/format_helpers.dart';
+
 /// Summary metrics for a completed budgeting week (Mon → Sun).
 class WeeklyOverviewSummary {
   final DateTime weekStart;
@@ -45,8 +47,8 @@ class WeeklyOverviewSummary {
 
   /// Serialises the summary to JSON for persistence inside reports.
   Map<String, dynamic> toJson() => {
-        'weekStart': _fmtDay(weekStart),
-        'weekEnd': _fmtDay(weekEnd),
+        'weekStart': isoDate(weekStart),
+        'weekEnd': isoDate(weekEnd),
         'incomeForWeek': incomeForWeek,
         'nonGoalBudgetTotal': nonGoalBudgetTotal,
         'goalBudgetTotal': goalBudgetTotal,
@@ -77,7 +79,4 @@ class WeeklyOverviewSummary {
       leftToSpend: (json['leftToSpend'] as num?)?.toDouble() ?? 0.0,
     );
   }
-
-  static String _fmtDay(DateTime d) =>
-      "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
 }
@@ -16,6 +16,7 @@ import 'dart:convert';
 
 import 'package:bfm_app/models/goal_model.dart';
 import 'package:bfm_app/models/weekly_overview_summary.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 
 /// Summarises a single category's budget vs spend for a week.
 class CategoryWeeklySummary {
@@ -110,8 +111,8 @@ class WeeklyInsightsReport {
 
   /// Human readable label (YYYY-MM-DD → YYYY-MM-DD).
   String get weekLabel {
-    final start = _fmtDay(weekStart);
-    final end = _fmtDay(weekEnd);
+    final start = isoDate(weekStart);
+    final end = isoDate(weekEnd);
     return "$start → $end";
   }
 
@@ -119,8 +120,8 @@ class WeeklyInsightsReport {
   double get savingsDelta => totalIncome - totalSpent;
 
   /// ISO strings for start/end (used everywhere else).
-  String get weekStartIso => _fmtDay(weekStart);
-  String get weekEndIso => _fmtDay(weekEnd);
+  String get weekStartIso => isoDate(weekStart);
+  String get weekEndIso => isoDate(weekEnd);
 
   /// Serialises the full report to JSON.
   Map<String, dynamic> toJson() => {
@@ -180,13 +181,10 @@ class WeeklyInsightsReport {
   static WeeklyInsightsReport fromEncodedJson(String encoded) =>
       WeeklyInsightsReport.fromJson(
           jsonDecode(encoded) as Map<String, dynamic>);
-
-  /// Formats a DateTime as YYYY-MM-DD for consistent serialization.
-  static String _fmtDay(DateTime d) =>
-      "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
 }
 
-/// Table row tying an auto-increment id to a serialized report blob.
+/// Table row pairing a week key with its serialized report blob. `id` only
+/// survives for rows read from the legacy pre-WITHOUT ROWID schema.
 class WeeklyReportEntry {
   final int? id;
   final WeeklyInsightsReport report;
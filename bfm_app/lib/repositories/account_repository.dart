@@ -18,6 +18,7 @@
 
 import 'package:bfm_app/db/app_database.dart';
 import 'package:bfm_app/models/account_model.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 import 'package:sqflite/sqflite.dart';
 
 /// Data access helpers for the `accounts` table.
@@ -63,28 +64,21 @@ class AccountRepository {
     if (items.isEmpty) return;
     final db = await AppDatabase.instance.database;
 
-    // Preserve existing excluded flags before upserting
-    final existingRows = await db.query('accounts',
-        columns: ['akahu_id', 'excluded']);
-    final excludedByAkahuId = <String, int>{};
-    for (final row in existingRows) {
-      final id = row['akahu_id'] as String?;
-      if (id != null) {
-        excludedByAkahuId[id] = (row['excluded'] as int?) ?? 0;
-      }
-    }
-
     final batch = db.batch();
     for (final item in items) {
       final account = AccountModel.fromAkahu(item);
       final map = account.toDbMap();
-      if (excludedByAkahuId.containsKey(account.akahuId)) {
-        map['excluded'] = excludedByAkahuId[account.akahuId];
-      }
-      batch.insert(
-        'accounts',
-        map,
-        conflictAlgorithm: ConflictAlgorithm.replace,
+      // Single-statement upsert: the COALESCE subselect carries forward the
+      // user's excluded flag from any row being replaced, so no pre-read of
+      // the table is needed.
+      final modelExcluded = map.remove('excluded') ?? 0;
+      final columns = map.keys.toList();
+      batch.rawInsert(
+        'INSERT OR REPLACE INTO accounts '
+        '(${columns.join(', ')}, excluded) '
+        'VALUES (${List.filled(columns.length, '?').join(', ')}, '
+        'COALESCE((SELECT excluded FROM accounts WHERE akahu_id = ?), ?))',
+        [...columns.map((c) => map[c]), account.akahuId, modelExcluded],
       );
     }
 
@@ -134,8 +128,8 @@ class AccountRepository {
     // This account's weekly spend per category over the last 30 days
     final now = DateTime.now();
     final windowStart = now.subtract(const Duration(days: 30));
-    final startStr = _isoDate(windowStart);
-    final endStr = _isoDate(now);
+    final startStr = isoDate(windowStart);
+    final endStr = isoDate(now);
     const weeks = 30 / 7; // ~4.29
 
     final spendRows = await db.rawQuery('''
@@ -212,9 +206,6 @@ class AccountRepository {
     return (budgetCount: budgetCount, recurringCount: recurringCount);
   }
 
-  static String _isoDate(DateTime d) =>
-      "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-
   /// Removes all accounts. Used during bank disconnect.
   static Future<void> clearAll() async {
     final db = await AppDatabase.instance.database;
@@ -307,9 +298,20 @@ class AccountRepository {
     return grouped;
   }
 
-  /// Returns a summary map for quick dashboard display.
+  /// Returns a typed balance summary for quick dashboard display. A record
+  /// rather than a map so callers get direct field access and the compiler
+  /// catches typos, matching [getLinkedBudgetAndRecurringCounts].
   /// Excludes accounts the user has deselected.
-  static Future<Map<String, dynamic>> getBalanceSummary() async {
+  static Future<
+      ({
+        double totalAssets,
+        double totalLiabilities,
+        double netWorth,
+        double totalSavings,
+        double totalChecking,
+        double totalInvestments,
+        int accountCount,
+      })> getBalanceSummary() async {
     final accounts = await getAll();
     
     double totalAssets = 0.0;
@@ -342,14 +344,14 @@ class AccountRepository {
       }
     }
     
-    return {
-      'totalAssets': totalAssets,
-      'totalLiabilities': totalLiabilities,
-      'netWorth': totalAssets - totalLiabilities,
-      'totalSavings': totalSavings,
-      'totalChecking': totalChecking,
-      'totalInvestments': totalInvestments,
-      'accountCount': accounts.length,
-    };
+    return (
+      totalAssets: totalAssets,
+      totalLiabilities: totalLiabilities,
+      netWorth: totalAssets - totalLiabilities,
+      totalSavings: totalSavings,
+      totalChecking: totalChecking,
+      totalInvestments: totalInvestments,
+      accountCount: accounts.length,
+    );
   }
 }
@@ -19,6 +19,38 @@ import 'package:sqflite/sqflite.dart';
 
 /// Thin repository around the `categories` table.
 class CategoryRepository {
+  /// In-memory name→id cache for [ensureByName]. Akahu sync resolves a
+  /// category per transaction, so repeat lookups skip SQLite entirely.
+  /// Keyed by lowercased name; ids are stable, so entries only need evicting
+  /// when a category row is deleted.
+  static final Map<String, int> _idByName = {};
+
+  /// Entries created inside a caller-held transaction (via the `executor`
+  /// parameter of [ensureByName]). Those rows aren't durable until the
+  /// transaction commits, so they stay quarantined here; the caller promotes
+  /// them with [commitPendingCache] after commit or drops them with
+  /// [discardPendingCache] on rollback. Caching them in [_idByName] directly
+  /// would leave dangling ids behind a rolled-back sync.
+  static final Map<String, int> _pendingByName = {};
+
+  /// Drops every cached name→id entry. Call after bulk deletes or debug
+  /// resets that touch the categories table directly.
+  static void clearCache() {
+    _idByName.clear();
+    _pendingByName.clear();
+  }
+
+  /// Promotes entries created during a now-committed transaction into the
+  /// main cache.
+  static void commitPendingCache() {
+    _idByName.addAll(_pendingByName);
+    _pendingByName.clear();
+  }
+
+  /// Forgets entries created during a transaction that rolled back; their
+  /// rows no longer exist.
+  static void discardPendingCache() => _pendingByName.clear();
+
   /// Inserts a category map. Uses `OR IGNORE` so re-inserting an existing name
   /// does not reset usage statistics.
   static Future<int> insert(Map<String, dynamic> category) async {
@@ -40,19 +72,48 @@ class CategoryRepository {
   /// Removes a category by id. Returns number of rows deleted.
   static Future<int> delete(int id) async {
     final db = await AppDatabase.instance.database;
+    _idByName.removeWhere((_, cachedId) => cachedId == id);
+    _pendingByName.removeWhere((_, cachedId) => cachedId == id);
     return await db.delete('categories', where: 'id = ?', whereArgs: [id]);
   }
 
   /// Ensures a row exists for [name] (case-insensitive) and returns its id.
   /// Also backfills Akahu metadata and icon/color if provided later.
+  /// Pass [executor] to run inside a caller-held transaction; querying the
+  /// database handle while it owns a transaction would deadlock.
   static Future<int> ensureByName(
     String name, {
     String? akahuCategoryId,
     String? icon,
     String? color,
+    DatabaseExecutor? executor,
   }) async {
     name = name.trim().isEmpty ? 'Uncategorized' : name.trim();
-    final db = await AppDatabase.instance.database;
+    final db = executor ?? await AppDatabase.instance.database;
+    final cacheKey = name.toLowerCase();
+    // Ids learned under a caller-held transaction go to the pending buffer so
+    // a rollback can't strand them in the main cache. Only the transaction
+    // that created them may read them back: to everyone else those rows are
+    // uncommitted and could still vanish.
+    final cache = executor != null ? _pendingByName : _idByName;
+
+    final cachedId = executor != null
+        ? _idByName[cacheKey] ?? _pendingByName[cacheKey]
+        : _idByName[cacheKey];
+    if (cachedId != null) {
+      // Row already known; still backfill metadata we just learned, but skip
+      // the existence lookup.
+      final updateMap = <String, Object?>{};
+      if (akahuCategoryId != null) updateMap['akahu_category_id'] = akahuCategoryId;
+      if (icon != null) updateMap['icon'] = icon;
+      if (color != null) updateMap['color'] = color;
+      if (updateMap.isNotEmpty) {
+        updateMap['last_used_at'] = DateTime.now().toIso8601String();
+        await db.update('categories', updateMap,
+            where: 'id = ?', whereArgs: [cachedId]);
+      }
+      return cachedId;
+    }
 
     final existing = await db.query(
       'categories',
@@ -71,6 +132,7 @@ class CategoryRepository {
         updateMap['last_used_at'] = DateTime.now().toIso8601String();
         await db.update('categories', updateMap, where: 'id = ?', whereArgs: [id]);
       }
+      cache[cacheKey] = id;
       return id;
     }
 
@@ -91,8 +153,11 @@ class CategoryRepository {
         whereArgs: [name],
         limit: 1,
       );
-      return again.first['id'] as int;
+      final existingId = again.first['id'] as int;
+      cache[cacheKey] = existingId;
+      return existingId;
     }
+    cache[cacheKey] = id;
     return id;
   }
 
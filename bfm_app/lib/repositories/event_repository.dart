@@ -27,15 +27,17 @@ class EventRepository {
     await db.transaction((txn) async {
       await txn.delete('events', where: 'backend_id IS NOT NULL');
       final nowIso = DateTime.now().toIso8601String();
+      final batch = txn.batch();
       for (final event in events) {
         final data = event.toMap();
         data['synced_at'] = nowIso;
-        await txn.insert(
+        batch.insert(
           'events',
           data,
           conflictAlgorithm: ConflictAlgorithm.replace,
         );
       }
+      await batch.commit(noResult: true);
     });
   }
 
@@ -20,6 +20,7 @@ import 'dart:math' as math;
 import 'package:bfm_app/db/app_database.dart';
 import 'package:bfm_app/models/goal_model.dart';
 import 'package:bfm_app/models/goal_progress_log.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 import 'package:sqflite/sqflite.dart';
 
 /// Handles CRUD + progress tracking for goals.
@@ -125,7 +126,7 @@ class GoalRepository {
     }
 
     final now = DateTime.now();
-    final periodStart = _mondayIso(now);
+    final periodStart = mondayIso(now);
     final label = goal.name.trim().isEmpty ? 'Goal' : goal.name.trim();
     final values = <String, dynamic>{
       'goal_id': goal.id,
@@ -137,19 +138,14 @@ class GoalRepository {
       'updated_at': now.toIso8601String(),
     };
 
-    final existing = await db.query(
-      'budgets',
-      where: 'goal_id = ?',
-      whereArgs: [goal.id],
-      limit: 1,
-    );
-
-    if (existing.isEmpty) {
+    // Update-first: the common path is an existing mirror row, so try the
+    // UPDATE and only fall back to INSERT when nothing matched. Saves the
+    // existence pre-read every call paid before.
+    final updated = await db.update('budgets', values,
+        where: 'goal_id = ?', whereArgs: [goal.id]);
+    if (updated == 0) {
       await db.insert('budgets', values,
           conflictAlgorithm: ConflictAlgorithm.replace);
-    } else {
-      await db.update('budgets', values,
-          where: 'goal_id = ?', whereArgs: [goal.id]);
     }
   }
 
@@ -191,7 +187,7 @@ class GoalRepository {
         [applied, goal.id],
       );
 
-      final weekKey = _mondayIso(DateTime.now());
+      final weekKey = mondayIso(DateTime.now());
       await _upsertGoalProgressAmount(
         txn,
         goal.id!,
@@ -205,16 +201,6 @@ class GoalRepository {
     });
   }
 
-  /// Returns the YYYY-MM-DD string for the Monday of `reference`.
-  static String _mondayIso(DateTime reference) {
-    final monday = reference.subtract(Duration(days: reference.weekday - 1));
-    return "${monday.year.toString().padLeft(4, '0')}-${monday.month.toString().padLeft(2, '0')}-${monday.day.toString().padLeft(2, '0')}";
-  }
-
-  /// Formats a DateTime as YYYY-MM-DD.
-  static String _isoDate(DateTime d) =>
-      "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-
   /// Fetches a single progress log row for a given goal + week if it exists.
   static Future<GoalProgressLog?> getProgressLogForWeek(
       int goalId, DateTime weekStart) async {
@@ -222,7 +208,7 @@ class GoalRepository {
     final rows = await db.query(
       'goal_progress_log',
       where: 'goal_id = ? AND week_start = ?',
-      whereArgs: [goalId, _isoDate(weekStart)],
+      whereArgs: [goalId, isoDate(weekStart)],
       limit: 1,
     );
     if (rows.isEmpty) return null;
@@ -245,7 +231,7 @@ class GoalRepository {
     }
     final goalId = goal.id!;
     final db = await AppDatabase.instance.database;
-    final weekKey = _isoDate(weekStart);
+    final weekKey = isoDate(weekStart);
     return await db.transaction((txn) async {
       final existing = await _fetchGoalProgressRow(txn, goalId, weekKey);
 
@@ -313,7 +299,7 @@ class GoalRepository {
   static Future<Map<int, double>> weeklyContributionTotals(
       DateTime weekStart) async {
     final db = await AppDatabase.instance.database;
-    final weekKey = _mondayIso(weekStart);
+    final weekKey = mondayIso(weekStart);
     final rows = await db.rawQuery(
       '''
       SELECT goal_id, SUM(amount) AS total
@@ -355,30 +341,32 @@ class GoalRepository {
     String? note,
   }) async {
     if (delta <= 0) return;
-    final existing = await _fetchGoalProgressRow(db, goalId, weekKey);
-    final now = DateTime.now().toIso8601String();
-    if (existing == null) {
+    // Update-first with the addition done in SQL, so we neither pre-read the
+    // row nor round-trip the current amount through Dart.
+    final setClauses = <String>['amount = amount + ?'];
+    final args = <Object?>[delta];
+    if (status.isNotEmpty) {
+      setClauses.add('status = ?');
+      args.add(status);
+    }
+    if (note != null) {
+      setClauses.add('note = ?');
+      args.add(note);
+    }
+    final updated = await db.rawUpdate(
+      'UPDATE goal_progress_log SET ${setClauses.join(', ')} '
+      'WHERE goal_id = ? AND week_start = ?',
+      [...args, goalId, weekKey],
+    );
+    if (updated == 0) {
       await db.insert('goal_progress_log', {
         'goal_id': goalId,
         'week_start': weekKey,
         'status': status,
         'amount': delta,
         'note': note,
-        'created_at': now,
+        'created_at': DateTime.now().toIso8601String(),
       });
-    } else {
-      final current = (existing['amount'] as num?)?.toDouble() ?? 0.0;
-      final update = <String, Object?>{
-        'amount': current + delta,
-      };
-      if (status.isNotEmpty) update['status'] = status;
-      if (note != null) update['note'] = note;
-      await db.update(
-        'goal_progress_log',
-        update,
-        where: 'goal_id = ? AND week_start = ?',
-        whereArgs: [goalId, weekKey],
-      );
     }
   }
 }
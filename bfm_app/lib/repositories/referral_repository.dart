@@ -27,15 +27,17 @@ class ReferralRepository {
     await db.transaction((txn) async {
       await txn.delete('referrals', where: 'backend_id IS NOT NULL');
       final nowIso = DateTime.now().toIso8601String();
+      final batch = txn.batch();
       for (final referral in referrals) {
         final data = referral.toMap();
         data['synced_at'] = nowIso;
-        await txn.insert(
+        batch.insert(
           'referrals',
           data,
           conflictAlgorithm: ConflictAlgorithm.replace,
         );
       }
+      await batch.commit(noResult: true);
     });
   }
 
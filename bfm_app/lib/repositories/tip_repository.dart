@@ -26,15 +26,17 @@ class TipRepository {
     await db.transaction((txn) async {
       await txn.delete('tips', where: 'backend_id IS NOT NULL');
       final nowIso = DateTime.now().toIso8601String();
+      final batch = txn.batch();
       for (final tip in tips) {
         final data = tip.toMap();
         data['synced_at'] = nowIso;
-        await txn.insert(
+        batch.insert(
           'tips',
           data,
           conflictAlgorithm: ConflictAlgorithm.replace,
         );
       }
+      await batch.commit(noResult: true);
     });
   }
 
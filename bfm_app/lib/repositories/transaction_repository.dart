@@ -22,6 +22,7 @@
 import 'package:bfm_app/db/app_database.dart';
 import 'package:bfm_app/models/transaction_model.dart';
 import 'package:bfm_app/repositories/category_repository.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 import 'package:sqflite/sqflite.dart';
 
 /// Data access helpers for the `transactions` table plus related analytics.
@@ -32,6 +33,66 @@ class TransactionRepository {
       "(account_id IS NULL OR account_id NOT IN "
       "(SELECT akahu_id FROM accounts WHERE excluded = 1))";
 
+  // Hot aggregate queries are declared const so every call hands SQLite the
+  // exact same statement text (keeping the platform's compiled-statement
+  // cache warm) instead of interpolating a fresh string per invocation.
+
+  static const _sqlCategoryTotals = '''
+      SELECT c.name as category, SUM(t.amount) as total
+      FROM transactions t
+      LEFT JOIN categories c ON t.category_id = c.id
+      WHERE t.type = 'expense'
+        AND t.excluded = 0
+        AND $_excludeDeselectedAccounts
+      GROUP BY c.name
+    ''';
+
+  static const _sqlWeekExpenses = '''
+      SELECT SUM(amount) AS spent
+      FROM transactions
+      WHERE type = 'expense'
+        AND date BETWEEN ? AND ?
+        AND excluded = 0
+        AND $_excludeDeselectedAccounts
+    ''';
+
+  static const _sqlExpensesByCategoryBetween = '''
+      SELECT category_id, ABS(SUM(amount)) AS spent
+      FROM transactions
+      WHERE type = 'expense'
+        AND excluded = 0
+        AND date BETWEEN ? AND ?
+        AND $_excludeDeselectedAccounts
+      GROUP BY category_id
+    ''';
+
+  static const _sqlIncomeBetween = '''
+      SELECT SUM(amount) AS income
+      FROM transactions
+      WHERE type = 'income'
+        AND excluded = 0
+        AND date BETWEEN ? AND ?
+        AND $_excludeDeselectedAccounts
+    ''';
+
+  static const _sqlHasTransactionsOn = '''
+      SELECT 1
+      FROM transactions
+      WHERE date = ?
+        AND excluded = 0
+        AND $_excludeDeselectedAccounts
+      LIMIT 1
+      ''';
+
+  static const _sqlHasTransactionsBetween = '''
+      SELECT 1
+      FROM transactions
+      WHERE date BETWEEN ? AND ?
+        AND excluded = 0
+        AND $_excludeDeselectedAccounts
+      LIMIT 1
+      ''';
+
   /// Returns the total number of rows in the transactions table.
   static Future<int> count() async {
     final db = await AppDatabase.instance.database;
@@ -87,16 +148,8 @@ class TransactionRepository {
   /// Totals grouped by category (expenses only).
   /// Excludes transactions from deselected accounts.
   static Future<Map<String, double>> getCategoryTotals() async {
-    final db = await AppDatabase.instance.database;
-    final result = await db.rawQuery('''
-      SELECT c.name as category, SUM(t.amount) as total
-      FROM transactions t
-      LEFT JOIN categories c ON t.category_id = c.id
-      WHERE t.type = 'expense'
-        AND t.excluded = 0
-        AND $_excludeDeselectedAccounts
-      GROUP BY c.name
-    ''');
+    final db = await AppDatabase.instance.readDatabase;
+    final result = await db.rawQuery(_sqlCategoryTotals);
 
     Map<String, double> totals = {};
     for (var row in result) {
@@ -108,27 +161,19 @@ class TransactionRepository {
 
   /// Expenses for the current week (Mon to today)
   static Future<double> getThisWeekExpenses() async {
-    final db = await AppDatabase.instance.database;
+    // Aggregates go through the read connection so a running sync batch
+    // doesn't stall the dashboard.
+    final db = await AppDatabase.instance.readDatabase;
     final now = DateTime.now();
 
     // Monday of the current week
     final startOfWeek =
         DateTime(now.year, now.month, now.day).subtract(Duration(days: now.weekday - 1));
 
-    String fmt(DateTime d) =>
-        "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
+    final start = isoDate(startOfWeek);
+    final end = isoDate(now);
 
-    final start = fmt(startOfWeek);
-    final end = fmt(now);
-
-    final res = await db.rawQuery('''
-      SELECT SUM(amount) AS spent
-      FROM transactions
-      WHERE type = 'expense'
-        AND date BETWEEN ? AND ?
-        AND excluded = 0
-        AND $_excludeDeselectedAccounts
-    ''', [start, end]);
+    final res = await db.rawQuery(_sqlWeekExpenses, [start, end]);
 
     final raw = (res.isNotEmpty ? res.first['spent'] : null);
     final value = (raw is num) ? raw.toDouble() : 0.0;
@@ -140,16 +185,9 @@ class TransactionRepository {
   /// Excludes transfers (type = 'transfer').
   static Future<Map<int?, double>> sumExpensesByCategoryBetween(
       DateTime start, DateTime end) async {
-    final db = await AppDatabase.instance.database;
-    final rows = await db.rawQuery('''
-      SELECT category_id, ABS(SUM(amount)) AS spent
-      FROM transactions
-      WHERE type = 'expense'
-        AND excluded = 0
-        AND date BETWEEN ? AND ?
-        AND $_excludeDeselectedAccounts
-      GROUP BY category_id
-    ''', [_iso(start), _iso(end)]);
+    final db = await AppDatabase.instance.readDatabase;
+    final rows = await db.rawQuery(
+        _sqlExpensesByCategoryBetween, [isoDate(start), isoDate(end)]);
     final map = <int?, double>{};
     for (final row in rows) {
       final catId = row['category_id'] as int?;
@@ -163,15 +201,9 @@ class TransactionRepository {
   /// Excludes transfers (type = 'transfer').
   static Future<double> sumIncomeBetween(
       DateTime start, DateTime end) async {
-    final db = await AppDatabase.instance.database;
-    final rows = await db.rawQuery('''
-      SELECT SUM(amount) AS income
-      FROM transactions
-      WHERE type = 'income'
-        AND excluded = 0
-        AND date BETWEEN ? AND ?
-        AND $_excludeDeselectedAccounts
-    ''', [_iso(start), _iso(end)]);
+    final db = await AppDatabase.instance.readDatabase;
+    final rows =
+        await db.rawQuery(_sqlIncomeBetween, [isoDate(start), isoDate(end)]);
     final value = rows.isNotEmpty ? rows.first['income'] : null;
     return (value is num) ? value.toDouble() : 0.0;
   }
@@ -186,7 +218,7 @@ class TransactionRepository {
       final rows = await db.query(
         'transactions',
         where: "date BETWEEN ? AND ? AND type != 'transfer' AND $_excludeDeselectedAccounts",
-        whereArgs: [_iso(start), _iso(end)],
+        whereArgs: [isoDate(start), isoDate(end)],
         orderBy: 'date DESC',
       );
       return rows.map((e) => TransactionModel.fromMap(e)).toList();
@@ -194,7 +226,7 @@ class TransactionRepository {
     final rows = await db.query(
       'transactions',
       where: 'date BETWEEN ? AND ? AND $_excludeDeselectedAccounts',
-      whereArgs: [_iso(start), _iso(end)],
+      whereArgs: [isoDate(start), isoDate(end)],
       orderBy: 'date DESC',
     );
     return rows.map((e) => TransactionModel.fromMap(e)).toList();
@@ -209,63 +241,56 @@ class TransactionRepository {
 
   /// Writes Akahu payloads to SQLite, ensuring categories exist and batching
   /// inserts for speed. Replaces matching rows by `akahu_hash`.
+  ///
+  /// The whole sync — category resolution included — runs in one transaction,
+  /// which sqflite opens with BEGIN IMMEDIATE. The write lock is taken up
+  /// front instead of once per category insert, and a failure mid-sync rolls
+  /// everything back rather than leaving categories without transactions.
   static Future<void> upsertFromAkahu(List<Map<String, dynamic>> items) async {
     if (items.isEmpty) return;
     final db = await AppDatabase.instance.database;
 
     final transactions = <TransactionModel>[];
-    final hashes = <String>[];
     for (var i = 0; i < items.length; i++) {
-      final txn = TransactionModel.fromAkahu(items[i], batchIndex: i);
-      transactions.add(txn);
-      final hash = txn.akahuHash?.trim();
-      if (hash != null && hash.isNotEmpty) {
-        hashes.add(hash);
-      }
+      transactions.add(TransactionModel.fromAkahu(items[i], batchIndex: i));
     }
 
-    final existingExcludedByHash = <String, int>{};
-    if (hashes.isNotEmpty) {
-      final unique = hashes.toSet().toList();
-      const chunkSize = 400;
-      for (var i = 0; i < unique.length; i += chunkSize) {
-        final end = (i + chunkSize) > unique.length ? unique.length : (i + chunkSize);
-        final chunk = unique.sublist(i, end);
-        final placeholders = List.filled(chunk.length, '?').join(',');
-        final rows = await db.rawQuery(
-          'SELECT akahu_hash, excluded FROM transactions WHERE akahu_hash IN ($placeholders)',
-          chunk,
-        );
-        for (final row in rows) {
-          final hash = row['akahu_hash'] as String?;
-          if (hash == null) continue;
-          final excludedFlag = _boolFromDb(row['excluded']) ? 1 : 0;
-          existingExcludedByHash[hash] = excludedFlag;
+    try {
+      await db.transaction((dbTxn) async {
+        final batch = dbTxn.batch();
+
+        for (var i = 0; i < transactions.length; i++) {
+          final txn = transactions[i];
+          final item = items[i];
+          final categoryId = await _resolveCategoryId(item, txn, dbTxn);
+          final map = txn.toDbMap();
+          map['category_id'] = categoryId;
+          map['category_name'] = txn.categoryName ?? 'Uncategorized';
+          // Single-statement upsert: the COALESCE subselect carries forward the
+          // user's excluded flag from any row being replaced, so no pre-read of
+          // existing hashes is needed.
+          final modelExcluded = map.remove('excluded');
+          final columns = map.keys.toList();
+          batch.rawInsert(
+            'INSERT OR REPLACE INTO transactions '
+            '(${columns.join(', ')}, excluded) '
+            'VALUES (${List.filled(columns.length, '?').join(', ')}, '
+            'COALESCE((SELECT excluded FROM transactions WHERE akahu_hash = ?), ?))',
+            [...columns.map((c) => map[c]), txn.akahuHash, modelExcluded],
+          );
         }
-      }
-    }
 
-    final batch = db.batch();
-
-    for (var i = 0; i < transactions.length; i++) {
-      final txn = transactions[i];
-      final item = items[i];
-      final categoryId = await _resolveCategoryId(item, txn);
-      final map = txn.toDbMap();
-      map['category_id'] = categoryId;
-      map['category_name'] = txn.categoryName ?? 'Uncategorized';
-      final hash = txn.akahuHash;
-      if (hash != null && existingExcludedByHash.containsKey(hash)) {
-        map['excluded'] = existingExcludedByHash[hash];
-      }
-      batch.insert(
-        'transactions',
-        map,
-        conflictAlgorithm: ConflictAlgorithm.replace,
-      );
+        await batch.commit(noResult: true);
+      });
+      // Category ids created above are only durable now that the transaction
+      // committed; promote them into the shared cache.
+      CategoryRepository.commitPendingCache();
+    } catch (_) {
+      // Rollback removed any categories inserted mid-sync — their cached ids
+      // would point at nothing, so drop them before the next attempt.
+      CategoryRepository.discardPendingCache();
+      rethrow;
     }
-
-    await batch.commit(noResult: true);
   }
 
   /// Persists a manually created transaction (usually from admin/debug tools).
@@ -280,14 +305,17 @@ class TransactionRepository {
   }
 
   /// Ensures there is a category row for the given transaction and returns its
-  /// id. Falls back to "Uncategorized" when no name exists.
+  /// id. Falls back to "Uncategorized" when no name exists. [executor] is the
+  /// transaction handle when called from inside [upsertFromAkahu]'s txn.
   static Future<int> _resolveCategoryId(
     Map<String, dynamic> raw,
     TransactionModel txn,
+    DatabaseExecutor executor,
   ) async {
     final catName = txn.categoryName?.trim();
     if (catName == null || catName.isEmpty) {
-      return CategoryRepository.ensureByName('Uncategorized');
+      return CategoryRepository.ensureByName('Uncategorized',
+          executor: executor);
     }
 
     // Extract Akahu category ID from nested object or flat field
@@ -305,6 +333,7 @@ class TransactionRepository {
     return CategoryRepository.ensureByName(
       catName,
       akahuCategoryId: akahuCategoryId,
+      executor: executor,
     );
   }
 
@@ -361,18 +390,6 @@ class TransactionRepository {
     );
   }
 
-  static bool _boolFromDb(dynamic raw) {
-    if (raw is bool) return raw;
-    if (raw is num) return raw != 0;
-    if (raw is String) {
-      final normalized = raw.trim().toLowerCase();
-      return normalized == '1' ||
-          normalized == 'true' ||
-          normalized == 'yes';
-    }
-    return false;
-  }
-
   /// Local normaliser (kept in sync with analysis) that lowercases and collapses
   /// whitespace while preserving digits for accurate grouping.
   static String _normalizeText(String raw) {
@@ -401,21 +418,28 @@ class TransactionRepository {
     );
     if (cat.isNotEmpty) catName = cat.first['name'] as String?;
 
-    // Pull uncategorized expenses and match by normalized description
-    final rows = await db.query(
-      'transactions',
-      columns: ['id', 'description'],
-      where: "type = 'expense' AND category_id IS NULL",
+    // Stream uncategorized expenses and match by normalized description.
+    // A cursor keeps memory at one buffer page instead of materialising the
+    // whole uncategorized set just to filter it in Dart.
+    final cursor = await db.rawQueryCursor(
+      "SELECT id, description FROM transactions "
+      "WHERE type = 'expense' AND category_id IS NULL",
+      null,
+      bufferSize: 200,
     );
-
     final idsToUpdate = <int>[];
-    for (final r in rows) {
-      final id = r['id'] as int?;
-      final desc = (r['description'] as String? ?? '');
-      final key = _normalizeText(desc);
-      if (id != null && key == normalizedDescriptionKey) {
-        idsToUpdate.add(id);
+    try {
+      while (await cursor.moveNext()) {
+        final r = cursor.current;
+        final id = r['id'] as int?;
+        final desc = (r['description'] as String? ?? '');
+        final key = _normalizeText(desc);
+        if (id != null && key == normalizedDescriptionKey) {
+          idsToUpdate.add(id);
+        }
       }
+    } finally {
+      await cursor.close();
     }
     if (idsToUpdate.isEmpty) return;
 
@@ -470,10 +494,10 @@ class TransactionRepository {
         AND $_excludeDeselectedAccounts
       GROUP BY $groupExpr
       ORDER BY period_date
-    ''', [_iso(start), _iso(end)]);
+    ''', [isoDate(start), isoDate(end)]);
 
     return rows.map((row) {
-      final dateStr = (row['period_date'] as String?) ?? _iso(start);
+      final dateStr = (row['period_date'] as String?) ?? isoDate(start);
       DateTime parsed;
       try {
         parsed = DateTime.parse(dateStr);
@@ -488,10 +512,6 @@ class TransactionRepository {
     }).toList();
   }
 
-  /// Formats a DateTime as YYYY-MM-DD so SQL comparisons stay consistent.
-  static String _iso(DateTime d) =>
-      "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-
   /// Expense totals grouped by normalized uncategorized key (description).
   /// Includes both truly uncategorized (null category_id) and transactions
   /// assigned to the "Uncategorized" category.
@@ -510,7 +530,7 @@ class TransactionRepository {
         AND (t.category_id IS NULL OR LOWER(c.name) IN ('uncategorized', 'uncategorised'))
         AND (t.account_id IS NULL OR t.account_id NOT IN
              (SELECT akahu_id FROM accounts WHERE excluded = 1))
-    ''', [_iso(start), _iso(end)]);
+    ''', [isoDate(start), isoDate(end)]);
     final map = <String, double>{};
     for (final row in rows) {
       final desc = (row['description'] as String?) ?? '';
@@ -534,8 +554,11 @@ class TransactionRepository {
   ) async {
     if (keys.isEmpty) return const {};
     final db = await AppDatabase.instance.database;
-    // Query for both null category_id AND transactions in the "Uncategorized" category
-    final rows = await db.rawQuery('''
+    // Query for both null category_id AND transactions in the "Uncategorized"
+    // category. Streamed through a cursor: once every requested key has a
+    // display name we stop fetching instead of having already paid for the
+    // full result set.
+    final cursor = await db.rawQueryCursor('''
       SELECT t.description
       FROM transactions t
       LEFT JOIN categories c ON t.category_id = c.id
@@ -546,20 +569,23 @@ class TransactionRepository {
         AND (t.account_id IS NULL OR t.account_id NOT IN
              (SELECT akahu_id FROM accounts WHERE excluded = 1))
       ORDER BY t.date DESC
-    ''', [_iso(start), _iso(end)]);
+    ''', [isoDate(start), isoDate(end)], bufferSize: 100);
     final result = <String, String>{};
     // Handle the unnamed transaction placeholder
     if (keys.contains('_unnamed_transaction')) {
       result['_unnamed_transaction'] = 'Unnamed Transaction';
     }
-    for (final row in rows) {
-      final desc = (row['description'] as String?) ?? '';
-      if (desc.trim().isEmpty) continue;
-      final key = _normalizeText(desc);
-      if (keys.contains(key) && !result.containsKey(key)) {
-        result[key] = desc;
-        if (result.length == keys.length) break;
+    try {
+      while (result.length < keys.length && await cursor.moveNext()) {
+        final desc = (cursor.current['description'] as String?) ?? '';
+        if (desc.trim().isEmpty) continue;
+        final key = _normalizeText(desc);
+        if (keys.contains(key) && !result.containsKey(key)) {
+          result[key] = desc;
+        }
       }
+    } finally {
+      await cursor.close();
     }
     return result;
   }
@@ -567,20 +593,10 @@ class TransactionRepository {
   /// Returns true when at least one non-excluded transaction exists for `day`.
   /// Excludes transactions from deselected accounts.
   static Future<bool> hasTransactionsOn(DateTime day) async {
-    final db = await AppDatabase.instance.database;
+    final db = await AppDatabase.instance.readDatabase;
     final normalized = DateTime(day.year, day.month, day.day);
-    final target = _iso(normalized);
-    final rows = await db.rawQuery(
-      '''
-      SELECT 1
-      FROM transactions
-      WHERE date = ?
-        AND excluded = 0
-        AND $_excludeDeselectedAccounts
-      LIMIT 1
-      ''',
-      [target],
-    );
+    final target = isoDate(normalized);
+    final rows = await db.rawQuery(_sqlHasTransactionsOn, [target]);
     return rows.isNotEmpty;
   }
 
@@ -588,17 +604,10 @@ class TransactionRepository {
   /// [start] and [end] (inclusive).
   /// Excludes transactions from deselected accounts.
   static Future<bool> hasTransactionsBetween(DateTime start, DateTime end) async {
-    final db = await AppDatabase.instance.database;
+    final db = await AppDatabase.instance.readDatabase;
     final rows = await db.rawQuery(
-      '''
-      SELECT 1
-      FROM transactions
-      WHERE date BETWEEN ? AND ?
-        AND excluded = 0
-        AND $_excludeDeselectedAccounts
-      LIMIT 1
-      ''',
-      [_iso(start), _iso(end)],
+      _sqlHasTransactionsBetween,
+      [isoDate(start), isoDate(end)],
     );
     return rows.isNotEmpty;
   }
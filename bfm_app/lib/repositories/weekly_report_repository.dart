@@ -17,14 +17,11 @@
 /// ---------------------------------------------------------------------------
 import 'package:bfm_app/db/app_database.dart';
 import 'package:bfm_app/models/weekly_report.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 import 'package:sqflite/sqflite.dart';
 
 /// Handles persistence of weekly insights report blobs.
 class WeeklyReportRepository {
-  /// Formats dates to ISO days for consistent keying.
-  static String _iso(DateTime d) =>
-      "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-
   /// Inserts or replaces the report for the specified week.
   static Future<void> upsert(WeeklyInsightsReport report) async {
     final db = await AppDatabase.instance.database;
@@ -57,7 +54,7 @@ class WeeklyReportRepository {
     final rows = await db.query(
       'weekly_reports',
       where: 'week_start = ?',
-      whereArgs: [_iso(weekStart)],
+      whereArgs: [isoDate(weekStart)],
       limit: 1,
     );
     if (rows.isEmpty) return null;
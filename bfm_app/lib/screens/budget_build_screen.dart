@@ -16,6 +16,7 @@ import 'package:bfm_app/services/budget_analysis_service.dart';
 import 'package:bfm_app/repositories/budget_repository.dart';
 import 'package:bfm_app/repositories/category_repository.dart';
 import 'package:bfm_app/utils/category_emoji_helper.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 import 'package:bfm_app/theme/buxly_theme.dart';
 
 class BudgetBuildScreen extends StatefulWidget {
@@ -282,11 +283,7 @@ class _BudgetBuildScreenState extends State<BudgetBuildScreen> {
     super.dispose();
   }
 
-  String _mondayOfThisWeek() {
-    final now = DateTime.now();
-    final monday = now.subtract(Duration(days: now.weekday - 1));
-    return "${monday.year.toString().padLeft(4, '0')}-${monday.month.toString().padLeft(2, '0')}-${monday.day.toString().padLeft(2, '0')}";
-  }
+  String _mondayOfThisWeek() => currentMondayIso();
 
   double _parseAmount(String s) {
     final v = double.tryParse(s.trim());
@@ -27,6 +27,7 @@ import 'package:bfm_app/services/dashboard_service.dart';
 import 'package:bfm_app/services/manual_budget_store.dart';
 import 'package:bfm_app/services/transaction_sync_service.dart';
 import 'package:bfm_app/utils/category_emoji_helper.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 import 'package:bfm_app/services/budget_buffer_refresh.dart';
 import 'package:bfm_app/services/budget_buffer_store.dart';
 import 'package:bfm_app/services/buxly_buffer_budget_store.dart';
@@ -508,11 +509,7 @@ class _BudgetsScreenState extends State<BudgetsScreen> {
     await _load();
   }
 
-  String _mondayOfThisWeek() {
-    final now = DateTime.now();
-    final monday = now.subtract(Duration(days: now.weekday - 1));
-    return "${monday.year.toString().padLeft(4, '0')}-${monday.month.toString().padLeft(2, '0')}-${monday.day.toString().padLeft(2, '0')}";
-  }
+  String _mondayOfThisWeek() => currentMondayIso();
 
   double _parseAmount(double? amount) {
     if (amount == null || amount.isNaN || amount.isInfinite) return 0.0;
@@ -19,6 +19,7 @@ import 'package:bfm_app/repositories/transaction_repository.dart';
 import 'package:bfm_app/services/budget_analysis_service.dart';
 import 'package:bfm_app/services/transaction_sync_service.dart';
 import 'package:bfm_app/utils/category_emoji_helper.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 import 'package:bfm_app/theme/buxly_theme.dart';
 
 class SubscriptionsScreen extends StatefulWidget {
@@ -286,11 +287,7 @@ class _SubscriptionsScreenState extends State<SubscriptionsScreen> {
     }
   }
 
-  String _mondayOfThisWeek() {
-    final now = DateTime.now();
-    final monday = now.subtract(Duration(days: now.weekday - 1));
-    return "${monday.year.toString().padLeft(4, '0')}-${monday.month.toString().padLeft(2, '0')}-${monday.day.toString().padLeft(2, '0')}";
-  }
+  String _mondayOfThisWeek() => currentMondayIso();
 
   double _parseAmount(String s) {
     final v = double.tryParse(s.trim());
@@ -16,6 +16,8 @@
 /// ---------------------------------------------------------------------------
 import 'dart:convert';
 import 'dart:developer';
+
+import 'package:flutter/foundation.dart';
 import 'package:http/http.dart' as http;
 
 /// Wraps direct Akahu HTTP calls behind static helpers.
@@ -25,6 +27,11 @@ import 'package:http/http.dart' as http;
 /// which goes through the Moni backend. Keep this for dev/test with manual
 /// token entry.
 class AkahuService {
+  /// Response bodies at or above this size are JSON-decoded on a background
+  /// isolate so a 365-day backfill page doesn't stall the UI thread. Small
+  /// pages decode inline because spawning an isolate costs more than parsing.
+  static const int _computeDecodeThreshold = 50 * 1024;
+
   static Map<String, String> _headers(String appToken, String userToken) => {
         "X-Akahu-Id": appToken,
         "Authorization": "Bearer $userToken",
@@ -131,7 +138,10 @@ class AkahuService {
         );
       }
 
-      final data = jsonDecode(response.body);
+      final body = response.body;
+      final data = body.length >= _computeDecodeThreshold
+          ? await compute(jsonDecode, body)
+          : jsonDecode(body);
       if (data is! Map<String, dynamic>) {
         throw Exception("Invalid response format: ${response.body}");
       }
@@ -28,6 +28,7 @@ import 'package:bfm_app/services/app_savings_store.dart';
 import 'package:bfm_app/services/budget_buffer_store.dart';
 import 'package:bfm_app/services/budget_seen_store.dart';
 import 'package:bfm_app/services/chat_storage.dart';
+import 'package:bfm_app/services/content_sync_service.dart';
 import 'package:bfm_app/services/income_settings_store.dart';
 import 'package:bfm_app/services/manual_budget_store.dart';
 import 'package:bfm_app/services/onboarding_store.dart';
@@ -138,6 +139,10 @@ class BankService {
     await AssetRepository.clearAll();
     await WeeklyReportRepository.clearAll();
     await EventRepository.clearAll();
+    // The events table is now empty but the content-sync fingerprints would
+    // still match the backend payload, so the next sync would skip the
+    // re-import. Drop them so the mirrors refill after reconnect.
+    await ContentSyncService.clearFingerprints();
 
     // ------ Reset category usage counters (keep categories themselves) ------
     final db = await AppDatabase.instance.database;
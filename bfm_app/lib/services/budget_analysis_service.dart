@@ -20,18 +20,25 @@
 /// ---------------------------------------------------------------------------
 
 import 'package:bfm_app/db/app_database.dart';
+import 'package:flutter/foundation.dart';
 import 'package:bfm_app/models/budget_suggestion_model.dart';
 import 'package:bfm_app/models/transaction_model.dart';
 import 'package:bfm_app/repositories/recurring_repository.dart';
 import 'package:bfm_app/repositories/transaction_repository.dart';
 import 'package:bfm_app/models/recurring_transaction_model.dart';
 import 'package:bfm_app/utils/description_normalizer.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 
 /// Houses all budget-related analytics (recurring detection + suggestions).
 class BudgetAnalysisService {
   static const double _kWeeksPerMonth = 4.345;
   static const double _kNearZeroThreshold = 0.5;
 
+  /// Minimum transactions per type before clustering moves to a worker
+  /// isolate. The detection is pure CPU (grouping, cadence checks) and scales
+  /// with history size; small sets finish faster than an isolate spawn.
+  static const int _kComputeClusterThreshold = 200;
+
   // -------------------- recurring detection --------------------
 
   /// Walks through local transactions, groups similar merchants/amounts, and
@@ -59,8 +66,26 @@ class BudgetAnalysisService {
         .where((t) => t.type.toLowerCase() == 'income' && withinWindow(t))
         .toList();
 
-    await _identifyRecurringClusters(expenses, transactionType: 'expense', now: now);
-    await _identifyRecurringClusters(incomes, transactionType: 'income', now: now);
+    final detected = [
+      ...await _detectClusters(expenses, 'expense', now),
+      ...await _detectClusters(incomes, 'income', now),
+    ];
+    for (final recurring in detected) {
+      await RecurringRepository.insert(recurring);
+    }
+  }
+
+  /// Runs the pure clustering pass, shipping it to a worker isolate when the
+  /// transaction list is large enough to jank the UI thread.
+  static Future<List<RecurringTransactionModel>> _detectClusters(
+    List<TransactionModel> txns,
+    String transactionType,
+    DateTime now,
+  ) async {
+    final input = (txns: txns, transactionType: transactionType, now: now);
+    return txns.length >= _kComputeClusterThreshold
+        ? await compute(_identifyRecurringClusters, input)
+        : _identifyRecurringClusters(input);
   }
 
   // -------------------- SUGGESTIONS --------------------
@@ -79,8 +104,8 @@ class BudgetAnalysisService {
     final today = DateTime.now();
     final windowEnd = DateTime(today.year, today.month, today.day);
     final windowStart = windowEnd.subtract(const Duration(days: 30));
-    final start = _formatDate(windowStart);
-    final end = _formatDate(windowEnd);
+    final start = isoDate(windowStart);
+    final end = isoDate(windowEnd);
     final weeks = (30 / 7).clamp(1, double.infinity) as double; // ~4.29 weeks
 
     // Recurring categories
@@ -276,10 +301,6 @@ class BudgetAnalysisService {
     return diff <= (a.abs() * pct);
   }
 
-  static String _formatDate(DateTime date) {
-    return "${date.year.toString().padLeft(4, '0')}-${date.month.toString().padLeft(2, '0')}-${date.day.toString().padLeft(2, '0')}";
-  }
-
   static bool _hasRecentWeeklyPattern(List<DateTime> dates, DateTime now) {
     final today = DateTime(now.year, now.month, now.day);
     final mondayThisWeek = today.subtract(Duration(days: today.weekday - 1));
@@ -345,13 +366,22 @@ class BudgetAnalysisService {
   static int _daysInMonth(int year, int month) =>
       DateTime(year, month + 1, 0).day;
 
-  /// Shared recurring logic for both expenses and income streams.
-  static Future<void> _identifyRecurringClusters(
-    List<TransactionModel> txns, {
-    required String transactionType,
-    required DateTime now,
-  }) async {
-    if (txns.isEmpty) return;
+  /// Shared recurring logic for both expenses and income streams. Pure
+  /// function over in-memory transactions (no database access) so it can run
+  /// on a worker isolate; returns the detected entries for the caller to
+  /// persist.
+  static List<RecurringTransactionModel> _identifyRecurringClusters(
+    ({
+      List<TransactionModel> txns,
+      String transactionType,
+      DateTime now,
+    }) input,
+  ) {
+    final txns = input.txns;
+    final transactionType = input.transactionType;
+    final now = input.now;
+    final detected = <RecurringTransactionModel>[];
+    if (txns.isEmpty) return detected;
 
     final Map<String, List<TransactionModel>> groups = {};
     for (final t in txns) {
@@ -407,8 +437,7 @@ class BudgetAnalysisService {
         } else {
           nextDue = _predictMonthlyDueDate(dates, lastDate);
         }
-        final nextDueStr =
-            "${nextDue.year.toString().padLeft(4, '0')}-${nextDue.month.toString().padLeft(2, '0')}-${nextDue.day.toString().padLeft(2, '0')}";
+        final nextDueStr = isoDate(nextDue);
 
         final firstDesc = cluster.first.description.trim();
         String friendlyDesc;
@@ -419,17 +448,16 @@ class BudgetAnalysisService {
           friendlyDesc = catName.isNotEmpty ? catName : 'Recurring $transactionType';
         }
 
-        final recurring = RecurringTransactionModel(
+        detected.add(RecurringTransactionModel(
           categoryId: cluster.first.categoryId ?? 1,
           amount: avgAmount.abs(),
           frequency: frequency,
           nextDueDate: nextDueStr,
           description: friendlyDesc,
           transactionType: transactionType,
-        );
-
-        await RecurringRepository.insert(recurring);
+        ));
       }
     }
+    return detected;
   }
 }
@@ -1,6 +1,7 @@
 import 'package:shared_preferences/shared_preferences.dart';
 import 'package:bfm_app/db/app_database.dart';
 import 'package:bfm_app/models/budget_model.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 
 /// Persists the Buxly Buffer recovery budget — a hidden budget that reserves
 /// weekly income to pay back a negative non-essential buffer over N weeks.
@@ -75,9 +76,6 @@ class BuxlyBufferBudgetStore {
     final latest = result.first['latest'] as String?;
     if (latest != null && latest.isNotEmpty) return latest;
 
-    final now = DateTime.now();
-    final monday = now.subtract(Duration(days: now.weekday - 1));
-    return "${monday.year}-${monday.month.toString().padLeft(2, '0')}"
-        "-${monday.day.toString().padLeft(2, '0')}";
+    return currentMondayIso();
   }
 }
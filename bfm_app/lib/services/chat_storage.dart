@@ -21,6 +21,8 @@
 /// ---------------------------------------------------------------------------
 
 import 'dart:convert';
+
+import 'package:flutter/foundation.dart';
 import 'package:shared_preferences/shared_preferences.dart';
 import 'package:bfm_app/models/chat_message.dart';
 
@@ -34,6 +36,11 @@ class ChatStorage {
   // Larger cap for summariser to read (older history).
   static const _kMaxSavedAll = 300;
 
+  // Blobs at or above this size are (de)serialised on a background isolate so
+  // a full 300-message history doesn't jank the chat screen. Short histories
+  // stay inline because isolate spawn costs more than the encode.
+  static const _kComputeThresholdBytes = 32 * 1024;
+
   /// Loads the recent slice shown in the UI (trimmed to `_kMaxSavedUi`).
   Future<List<ChatMessage>> loadMessages() async {
     final all = await loadAllMessages();
@@ -48,7 +55,10 @@ class ChatStorage {
     final raw = prefs.getString(_kKey);
     if (raw == null || raw.isEmpty) return [];
     try {
-      final list = (jsonDecode(raw) as List)
+      final decoded = raw.length >= _kComputeThresholdBytes
+          ? await compute(jsonDecode, raw)
+          : jsonDecode(raw);
+      final list = (decoded as List)
           .cast<Map<String, dynamic>>()
           .map(ChatMessage.fromJson)
           .toList();
@@ -64,7 +74,14 @@ class ChatStorage {
     // Persist with larger cap; UI decides how much to show/send
     final trimmed = messages.takeLast(_kMaxSavedAll).toList();
     final jsonList = trimmed.map((m) => m.toJson()).toList();
-    await prefs.setString(_kKey, jsonEncode(jsonList));
+    // Rough size guess (message contents dominate) decides whether encoding
+    // is worth shipping to a worker isolate.
+    final approxBytes =
+        trimmed.fold<int>(0, (sum, m) => sum + m.content.length);
+    final encoded = approxBytes >= _kComputeThresholdBytes
+        ? await compute(jsonEncode, jsonList)
+        : jsonEncode(jsonList);
+    await prefs.setString(_kKey, encoded);
   }
 
   /// Deletes every stored message, used for reset buttons.
@@ -25,8 +25,10 @@ import 'package:bfm_app/models/tip_model.dart';
 import 'package:bfm_app/repositories/event_repository.dart';
 import 'package:bfm_app/repositories/referral_repository.dart';
 import 'package:bfm_app/repositories/tip_repository.dart';
+import 'package:crypto/crypto.dart';
 import 'package:flutter/foundation.dart';
 import 'package:http/http.dart' as http;
+import 'package:shared_preferences/shared_preferences.dart';
 
 /// Singleton that pulls dashboard content from the authenticated Moni backend
 /// (tips, events) and the legacy CMS (referrals) into local SQLite.
@@ -37,6 +39,9 @@ class ContentSyncService {
 
   final http.Client _client = http.Client();
 
+  static const _kFingerprintPrefix = 'content_sync.fingerprint.';
+  static const _kFeeds = ['referrals', 'tips', 'events'];
+
   late final ContentApi _contentApi = ContentApi(
     ApiClient(tokenStore: TokenStore()),
   );
@@ -52,6 +57,8 @@ class ContentSyncService {
   Future<void> syncReferrals() async {
     try {
       final list = await _fetchList('/api/referrals', {'limit': '200'});
+      final fingerprint = _fingerprint(list);
+      if (await _isUnchanged('referrals', fingerprint)) return;
       final models = list
           .whereType<Map<String, dynamic>>()
           .map(_mapReferral)
@@ -59,6 +66,7 @@ class ContentSyncService {
           .toList();
       if (models.isNotEmpty) {
         await ReferralRepository.replaceWithBackend(models);
+        await _rememberFingerprint('referrals', fingerprint);
       }
     } catch (err, stack) {
       _log('referral sync failed: $err', stack);
@@ -69,12 +77,15 @@ class ContentSyncService {
   Future<void> syncTips() async {
     try {
       final list = await _contentApi.tips();
+      final fingerprint = _fingerprint(list);
+      if (await _isUnchanged('tips', fingerprint)) return;
       final models = list
           .map(_mapTip)
           .whereType<TipModel>()
           .toList();
       if (models.isNotEmpty) {
         await TipRepository.replaceWithBackend(models);
+        await _rememberFingerprint('tips', fingerprint);
       }
     } catch (err, stack) {
       _log('tip sync failed: $err', stack);
@@ -85,18 +96,51 @@ class ContentSyncService {
   Future<void> syncEvents() async {
     try {
       final list = await _contentApi.events();
+      final fingerprint = _fingerprint(list);
+      if (await _isUnchanged('events', fingerprint)) return;
       final models = list
           .map(_mapEvent)
           .whereType<EventModel>()
           .toList();
       if (models.isNotEmpty) {
         await EventRepository.replaceWithBackend(models);
+        await _rememberFingerprint('events', fingerprint);
       }
     } catch (err, stack) {
       _log('event sync failed: $err', stack);
     }
   }
 
+  /// Local stand-in for HTTP ETags: the backend sends no cache headers, so we
+  /// hash each feed's raw payload and compare it against the last synced one.
+  /// An unchanged feed skips the whole SQLite delete-and-reinsert.
+  String _fingerprint(List<dynamic> payload) =>
+      sha256.convert(utf8.encode(jsonEncode(payload))).toString();
+
+  /// True when [fingerprint] matches the stored hash for [feed], meaning the
+  /// local mirror is already up to date.
+  Future<bool> _isUnchanged(String feed, String fingerprint) async {
+    final prefs = await SharedPreferences.getInstance();
+    return prefs.getString('$_kFingerprintPrefix$feed') == fingerprint;
+  }
+
+  /// Records [fingerprint] after a successful replace so a failed write never
+  /// causes the next sync to skip.
+  Future<void> _rememberFingerprint(String feed, String fingerprint) async {
+    final prefs = await SharedPreferences.getInstance();
+    await prefs.setString('$_kFingerprintPrefix$feed', fingerprint);
+  }
+
+  /// Forgets every stored feed fingerprint. Must be called whenever the
+  /// mirrored tables are wiped outside this service (bank disconnect),
+  /// otherwise the next sync matches the stale hash and skips the re-import.
+  static Future<void> clearFingerprints() async {
+    final prefs = await SharedPreferences.getInstance();
+    for (final feed in _kFeeds) {
+      await prefs.remove('$_kFingerprintPrefix$feed');
+    }
+  }
+
   /// Close the underlying HTTP client when the app shuts down or tests finish.
   void dispose() {
     _client.close();
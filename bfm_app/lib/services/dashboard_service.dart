@@ -35,6 +35,7 @@ import 'package:bfm_app/repositories/tip_repository.dart';
 import 'package:bfm_app/repositories/transaction_repository.dart';
 import 'package:bfm_app/services/income_settings_store.dart';
 import 'package:bfm_app/utils/category_emoji_helper.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 
 /// Aggregates all database work needed to populate the dashboard.
 class DashboardService {
@@ -50,10 +51,8 @@ class DashboardService {
     final db = await AppDatabase.instance.database;
     final now = DateTime.now();
     final monday = now.subtract(Duration(days: now.weekday - 1));
-    String fmt(DateTime d) =>
-        "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-    final start = fmt(monday);
-    final end = fmt(now);
+    final start = isoDate(monday);
+    final end = isoDate(now);
 
     final res = await db.rawQuery(
       '''
@@ -130,10 +129,6 @@ class DashboardService {
   // income & header helpers
   // ---------------------------------------------------------------------------
 
-  /// Formats a DateTime into YYYY-MM-DD for SQL filters.
-  static String _fmtDay(DateTime d) =>
-      "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-
   /// Weekly income based on user's income type setting:
   /// - Regular income: uses last week's actual income
   /// - Non-regular income: uses average weekly income over last 4 weeks
@@ -151,8 +146,8 @@ class DashboardService {
     final db = await AppDatabase.instance.database;
     final now = DateTime.now();
     final monday = now.subtract(Duration(days: now.weekday - 1));
-    final start = _fmtDay(monday);
-    final end = _fmtDay(now);
+    final start = isoDate(monday);
+    final end = isoDate(now);
 
     final res = await db.rawQuery(
       '''
@@ -174,8 +169,8 @@ class DashboardService {
     final db = await AppDatabase.instance.database;
     final now = DateTime.now();
     final mondayThisWeek = now.subtract(Duration(days: now.weekday - 1));
-    final start = _fmtDay(mondayThisWeek.subtract(const Duration(days: 7)));
-    final end = _fmtDay(mondayThisWeek.subtract(const Duration(days: 1)));
+    final start = isoDate(mondayThisWeek.subtract(const Duration(days: 7)));
+    final end = isoDate(mondayThisWeek.subtract(const Duration(days: 1)));
 
     final res = await db.rawQuery(
       '''
@@ -199,8 +194,8 @@ class DashboardService {
     final mondayThisWeek = now.subtract(Duration(days: now.weekday - 1));
 
     // Go back 4 weeks from current Monday
-    final start = _fmtDay(mondayThisWeek.subtract(const Duration(days: 28)));
-    final end = _fmtDay(mondayThisWeek.subtract(const Duration(days: 1)));
+    final start = isoDate(mondayThisWeek.subtract(const Duration(days: 28)));
+    final end = isoDate(mondayThisWeek.subtract(const Duration(days: 1)));
 
     final res = await db.rawQuery(
       '''
@@ -237,8 +232,8 @@ class DashboardService {
 
     if (incomeType == IncomeType.nonRegular) {
       // Average of 4 weeks ending before the reference week
-      final start = _fmtDay(monday.subtract(const Duration(days: 28)));
-      final end = _fmtDay(monday.subtract(const Duration(days: 1)));
+      final start = isoDate(monday.subtract(const Duration(days: 28)));
+      final end = isoDate(monday.subtract(const Duration(days: 1)));
 
       final res = await db.rawQuery(
         '''
@@ -256,8 +251,8 @@ class DashboardService {
       return totalIncome / 4.0;
     } else {
       // Regular: actual income for the week before reference week
-      final start = _fmtDay(monday.subtract(const Duration(days: 7)));
-      final end = _fmtDay(monday.subtract(const Duration(days: 1)));
+      final start = isoDate(monday.subtract(const Duration(days: 7)));
+      final end = isoDate(monday.subtract(const Duration(days: 1)));
 
       final res = await db.rawQuery(
         '''
@@ -302,10 +297,8 @@ class DashboardService {
     // Resolve current week window (Mon → today)
     final now = DateTime.now();
     final monday = now.subtract(Duration(days: now.weekday - 1));
-    String fmt(DateTime d) =>
-        "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-    final start = fmt(monday);
-    final end = fmt(now);
+    final start = isoDate(monday);
+    final end = isoDate(now);
 
     final budgets = await _latestBudgetsByCategory();
 
@@ -584,10 +577,8 @@ class DashboardService {
 
     final now = DateTime.now();
     final monday = now.subtract(Duration(days: now.weekday - 1));
-    String fmt(DateTime d) =>
-        "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-    final start = fmt(monday);
-    final end = fmt(now);
+    final start = isoDate(monday);
+    final end = isoDate(now);
 
     final rows = await db.rawQuery(
       '''
@@ -40,6 +40,15 @@ class PinStore {
 
   final FlutterSecureStorage _storage;
 
+  /// Process-wide cache of the stored salt + hash. Each secure-storage read is
+  /// a platform-channel round trip paid on every unlock attempt, but the pair
+  /// only changes through [setPin]/[clearPin]. Caching the hash (never the raw
+  /// PIN) adds no exposure beyond what reading it back already has. Shared
+  /// across instances because they all wrap the same storage keys.
+  static String? _cachedSalt;
+  static String? _cachedHash;
+  static bool _cacheValid = false;
+
   /// Returns `true` when a hashed PIN is present.
   /// Keeps screens lightweight by avoiding manual key lookups.
   Future<bool> hasPin() async {
@@ -56,6 +65,9 @@ class PinStore {
       _storage.write(key: _pinKey, value: hash),
       _storage.write(key: _saltKey, value: salt),
     ]);
+    _cachedSalt = salt;
+    _cachedHash = hash;
+    _cacheValid = true;
   }
 
   /// Returns the number of consecutive failed attempts.
@@ -99,8 +111,20 @@ class PinStore {
       throw PinLockedException(lockoutEnd);
     }
 
-    final salt = await _storage.read(key: _saltKey);
-    final storedHash = await _storage.read(key: _pinKey);
+    // Serve salt + hash from the in-memory cache when we have it; otherwise
+    // fetch both in parallel — each read is a platform-channel round trip
+    // that dwarfs the SHA-256 below.
+    if (!_cacheValid) {
+      final stored = await Future.wait([
+        _storage.read(key: _saltKey),
+        _storage.read(key: _pinKey),
+      ]);
+      _cachedSalt = stored[0];
+      _cachedHash = stored[1];
+      _cacheValid = true;
+    }
+    final salt = _cachedSalt;
+    final storedHash = _cachedHash;
     if (salt == null || storedHash == null) {
       return false;
     }
@@ -161,6 +185,9 @@ class PinStore {
       _storage.delete(key: _failedAttemptsKey),
       _storage.delete(key: _lockoutUntilKey),
     ]);
+    _cachedSalt = null;
+    _cachedHash = null;
+    _cacheValid = true;
   }
 
   /// Creates a SHA-256 hash by concatenating `salt|pin`.
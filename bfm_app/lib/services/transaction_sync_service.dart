@@ -49,6 +49,13 @@ class TransactionSyncService {
   static bool _syncing = false;
   static Future<void>? _activeSyncFuture;
 
+  /// Shared backend client, built once per process. Constructing a fresh
+  /// Dio + interceptor chain per sync throws away the warm connection pool,
+  /// so every service instance routes through this long-lived client instead.
+  static final TokenStore _tokenStore = TokenStore();
+  static final AkahuApi _backendApi =
+      AkahuApi(ApiClient(tokenStore: _tokenStore));
+
   /// Whether a sync is currently in progress.
   static bool get isSyncing => _syncing;
 
@@ -96,7 +103,7 @@ class TransactionSyncService {
     }
 
     // Try backend-proxied path first
-    final backendToken = await TokenStore().getToken();
+    final backendToken = await _tokenStore.getToken();
     if (backendToken != null && backendToken.isNotEmpty) {
       try {
         await _syncViaBackend();
@@ -116,9 +123,7 @@ class TransactionSyncService {
   Future<void> _syncViaBackend() async {
     final syncStart = DateTime.now();
     final prefs = await SharedPreferences.getInstance();
-    final tokenStore = TokenStore();
-    final client = ApiClient(tokenStore: tokenStore);
-    final api = AkahuApi(client);
+    final api = _backendApi;
 
     final nowUtc = DateTime.now().toUtc();
     final hasBackfilled = prefs.getBool(_backfillCompleteKey) ?? false;
@@ -290,7 +295,7 @@ class TransactionSyncService {
     if (!connected) return false;
 
     // Need either a backend JWT or direct Akahu tokens
-    final backendToken = await TokenStore().getToken();
+    final backendToken = await _tokenStore.getToken();
     final hasBackend = backendToken != null && backendToken.isNotEmpty;
     final hasDirectTokens = (await _credentialStore.readAkahuTokens()) != null;
     if (!hasBackend && !hasDirectTokens) return false;
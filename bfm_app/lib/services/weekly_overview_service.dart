@@ -18,6 +18,7 @@ import 'package:bfm_app/repositories/goal_repository.dart';
 import 'package:bfm_app/repositories/transaction_repository.dart';
 import 'package:bfm_app/repositories/weekly_report_repository.dart';
 import 'package:bfm_app/services/insights_service.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 import 'package:shared_preferences/shared_preferences.dart';
 
 /// Bundle of data required to render the weekly overview sheet.
@@ -64,7 +65,7 @@ class WeeklyOverviewService {
   /// Records that the overview for the provided week has been surfaced.
   static Future<void> markOverviewHandled(DateTime weekStart) async {
     final prefs = await SharedPreferences.getInstance();
-    await prefs.setString(_prefsLastWeekKey, _iso(weekStart));
+    await prefs.setString(_prefsLastWeekKey, isoDate(weekStart));
   }
 
   /// Marks the previous week as already handled so the weekly overview is
@@ -102,7 +103,7 @@ class WeeklyOverviewService {
 
     final targetWeekStart = _previousWeekStart(today);
     final lastShownIso = prefs.getString(_prefsLastWeekKey);
-    if (lastShownIso == _iso(targetWeekStart)) return false;
+    if (lastShownIso == isoDate(targetWeekStart)) return false;
 
     return true;
   }
@@ -136,6 +137,4 @@ class WeeklyOverviewService {
     return mondayThisWeek.subtract(const Duration(days: 7));
   }
 
-  static String _iso(DateTime day) =>
-      "${day.year.toString().padLeft(4, '0')}-${day.month.toString().padLeft(2, '0')}-${day.day.toString().padLeft(2, '0')}";
 }
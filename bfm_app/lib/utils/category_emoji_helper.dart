@@ -9,6 +9,12 @@ class CategoryEmojiHelper {
 
   final Map<String, String> _categoryGroups;
 
+  /// Memoized lookups keyed by normalized name. The keyword fallback scans
+  /// every needle list on each miss, and dashboard/budget rows ask for the
+  /// same handful of names on every rebuild, so resolving each name once is
+  /// enough. Bounded by the user's distinct category/budget names.
+  final Map<String, String> _resolved = {};
+
   static CategoryEmojiHelper? _instance;
 
   static const String defaultEmoji = '💸';
@@ -260,16 +266,17 @@ class CategoryEmojiHelper {
       return defaultEmoji;
     }
     final normalized = rawName.trim().toLowerCase();
+    return _resolved.putIfAbsent(normalized, () {
+      final specific = _categoryEmoji[normalized];
+      if (specific != null) return specific;
 
-    final specific = _categoryEmoji[normalized];
-    if (specific != null) return specific;
-
-    final group = _categoryGroups[normalized];
-    if (group != null) {
-      return _groupEmoji[group] ?? defaultEmoji;
-    }
+      final group = _categoryGroups[normalized];
+      if (group != null) {
+        return _groupEmoji[group] ?? defaultEmoji;
+      }
 
-    return _emojiFromText(rawName);
+      return _emojiFromText(normalized);
+    });
   }
 
   static const Map<String, List<String>> _groupKeywords = {
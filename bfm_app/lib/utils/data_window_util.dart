@@ -21,13 +21,10 @@
 /// ---------------------------------------------------------------------------
 
 import 'package:bfm_app/db/app_database.dart';
+import 'package:bfm_app/utils/format_helpers.dart';
 
 /// Wraps raw database lookups for transaction windows.
 class DataWindowUtil {
-  /// Formats a DateTime into `YYYY-MM-DD` so analytics stay ISO-friendly.
-  static String _fmt(DateTime d) =>
-      "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
-
   /// Queries the DB for the first/last transaction dates, falls back to "now"
   /// when empty, clamps the day span, and returns pre-formatted values plus the
   /// derived week count. Callers use this to scale totals to per-week numbers.
@@ -43,8 +40,8 @@ class DataWindowUtil {
         .first;
 
     final now = DateTime.now();
-    final startStr = (row['start'] as String?) ?? _fmt(now);
-    final endStr   = (row['end']   as String?) ?? _fmt(now);
+    final startStr = (row['start'] as String?) ?? isoDate(now);
+    final endStr   = (row['end']   as String?) ?? isoDate(now);
 
     DateTime parse(String s) { try { return DateTime.parse(s); } catch (_) { return now; } }
 
@@ -52,6 +49,6 @@ class DataWindowUtil {
     final end   = parse(endStr);
     final int days  = ((end.difference(start).inDays).abs() + 1).clamp(1, 3650);
     final double weeks = days / 7.0;
-    return (start: _fmt(start), end: _fmt(end), days: days, weeks: weeks < 1.0 ? 1.0 : weeks);
+    return (start: isoDate(start), end: isoDate(end), days: days, weeks: weeks < 1.0 ? 1.0 : weeks);
   }
 }
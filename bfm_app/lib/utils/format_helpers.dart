@@ -33,11 +33,16 @@ double parseCurrency(String raw) {
   return value;
 }
 
-/// Returns the ISO date string for Monday of the current week.
-String currentMondayIso() {
-  final now = DateTime.now();
-  final monday = now.subtract(Duration(days: now.weekday - 1));
-  final month = monday.month.toString().padLeft(2, '0');
-  final day = monday.day.toString().padLeft(2, '0');
-  return '${monday.year}-$month-$day';
+/// Formats a date as ISO `YYYY-MM-DD`, the canonical form stored in SQLite.
+/// The single source of truth for this format — don't re-implement it locally.
+String isoDate(DateTime d) =>
+    "${d.year.toString().padLeft(4, '0')}-${d.month.toString().padLeft(2, '0')}-${d.day.toString().padLeft(2, '0')}";
+
+/// Returns the ISO date string for the Monday of [reference]'s week.
+String mondayIso(DateTime reference) {
+  final monday = reference.subtract(Duration(days: reference.weekday - 1));
+  return isoDate(monday);
 }
+
+/// Returns the ISO date string for Monday of the current week.
+String currentMondayIso() => mondayIso(DateTime.now());
@@ -0,0 +1,73 @@
+import 'package:bfm_app/db/app_database.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:path/path.dart';
+import 'package:sqflite/sqflite.dart';
+import 'package:sqflite_common_ffi/sqflite_ffi.dart';
+
+void main() {
+  TestWidgetsFlutterBinding.ensureInitialized();
+
+  setUpAll(() {
+    sqfliteFfiInit();
+    databaseFactory = databaseFactoryFfi;
+  });
+
+  setUp(() async {
+    await AppDatabase.instance.close();
+    final dbPath = await getDatabasesPath();
+    final fullPath = join(dbPath, 'bfm_app.db');
+    await databaseFactory.deleteDatabase(fullPath);
+  });
+
+  test('legacy rowid weekly_reports rows survive the upgrade', () async {
+    final dbPath = await getDatabasesPath();
+    final fullPath = join(dbPath, 'bfm_app.db');
+
+    // Recreate the pre-migration schema at an old user_version so opening
+    // through AppDatabase triggers _upgradeDB.
+    final legacy = await openDatabase(
+      fullPath,
+      version: 1,
+      onCreate: (db, version) async {
+        await db.execute('''
+          CREATE TABLE weekly_reports (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            week_start TEXT NOT NULL UNIQUE,
+            week_end TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+          );
+        ''');
+      },
+    );
+    await legacy.insert('weekly_reports', {
+      'week_start': '2025-09-01',
+      'week_end': '2025-09-07',
+      'data': '{"spent": 120.5}',
+      'created_at': '2025-09-08T00:00:00.000Z',
+    });
+    await legacy.insert('weekly_reports', {
+      'week_start': '2025-09-08',
+      'week_end': '2025-09-14',
+      'data': '{"spent": 87.0}',
+      'created_at': '2025-09-15T00:00:00.000Z',
+    });
+    await legacy.close();
+
+    final db = await AppDatabase.instance.database;
+
+    final rows = await db.query('weekly_reports', orderBy: 'week_start ASC');
+    expect(rows.length, 2);
+    expect(rows.first['week_start'], '2025-09-01');
+    expect(rows.first['week_end'], '2025-09-07');
+    expect(rows.first['data'], '{"spent": 120.5}');
+    expect(rows.first['created_at'], '2025-09-08T00:00:00.000Z');
+    expect(rows.last['week_start'], '2025-09-08');
+
+    // The rebuilt table is keyed on week_start and has no rowid id column.
+    final columns = await db.rawQuery('PRAGMA table_info(weekly_reports)');
+    final names = columns.map((c) => c['name'] as String).toList();
+    expect(names, isNot(contains('id')));
+    expect(names, contains('week_start'));
+  });
+}